@@ -1,6 +1,11 @@
 from django import forms
 from django.contrib.auth.forms import UserCreationForm
-from django.contrib.auth.models import User
+from django.contrib.auth.models import Group, User
+
+
+def _group_pk(name):
+    """Return the primary key of the named group without loading the row."""
+    return Group.objects.values_list('pk', flat=True).get(name=name)
 
 
 class CustomUserCreationForm(UserCreationForm):
@@ -24,17 +29,18 @@ class CustomUserCreationForm(UserCreationForm):
         model = User
         fields = ('username', 'email', 'password1', 'password2')
     
+    # Bootstrap widget attributes applied to each field on instantiation
+    _DEFAULT_ATTRS = {'class': 'form-control'}
+    _WIDGET_ATTRS = {
+        'username': {'class': 'form-control', 'placeholder': 'Choose a username'},
+        'password1': {'class': 'form-control', 'placeholder': 'Create a password'},
+        'password2': {'class': 'form-control', 'placeholder': 'Confirm password'},
+    }
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Add Bootstrap classes to all fields
         for field_name, field in self.fields.items():
-            field.widget.attrs['class'] = 'form-control'
-            if field_name == 'username':
-                field.widget.attrs['placeholder'] = 'Choose a username'
-            elif field_name == 'password1':
-                field.widget.attrs['placeholder'] = 'Create a password'
-            elif field_name == 'password2':
-                field.widget.attrs['placeholder'] = 'Confirm password'
+            field.widget.attrs.update(self._WIDGET_ATTRS.get(field_name, self._DEFAULT_ATTRS))
     
     def save(self, commit=True):
         """Save user and assign to Viewers group by default."""
@@ -42,11 +48,8 @@ class CustomUserCreationForm(UserCreationForm):
         user.email = self.cleaned_data['email']
         if commit:
             user.save()
-            # Import here to avoid circular imports
-            from django.contrib.auth.models import Group
             try:
-                viewers_group = Group.objects.get(name='Viewers')
-                user.groups.add(viewers_group)
+                user.groups.add(_group_pk('Viewers'))
             except Group.DoesNotExist:
                 pass  # Group will be created by migration
         return user
@@ -13,11 +13,11 @@ def create_groups(apps, schema_editor):
     Permission = apps.get_model('auth', 'Permission')
     ContentType = apps.get_model('contenttypes', 'ContentType')
     
-    # Create Viewers group (no special permissions - read-only via API)
-    viewers_group, _ = Group.objects.get_or_create(name='Viewers')
-    
-    # Create Editors group with facility management permissions
-    editors_group, _ = Group.objects.get_or_create(name='Editors')
+    # Create Viewers (read-only via API) and Editors groups in one INSERT
+    Group.objects.bulk_create(
+        [Group(name='Viewers'), Group(name='Editors')],
+        ignore_conflicts=True,
+    )
     
     # Try to get EmergencyFacility content type and permissions
     try:
@@ -27,14 +27,17 @@ def create_groups(apps, schema_editor):
             model='emergencyfacility'
         )
         
-        # Get permissions for EmergencyFacility
-        facility_permissions = Permission.objects.filter(
-            content_type=facility_ct,
-            codename__in=['add_emergencyfacility', 'change_emergencyfacility', 'delete_emergencyfacility']
+        # Get permission IDs for EmergencyFacility (no model instances needed)
+        facility_permission_ids = list(
+            Permission.objects.filter(
+                content_type=facility_ct,
+                codename__in=['add_emergencyfacility', 'change_emergencyfacility', 'delete_emergencyfacility']
+            ).values_list('pk', flat=True)
         )
         
         # Assign all facility permissions to Editors
-        editors_group.permissions.set(facility_permissions)
+        editors_group = Group.objects.get(name='Editors')
+        editors_group.permissions.set(facility_permission_ids)
         
     except ContentType.DoesNotExist:
         # ContentType doesn't exist yet - permissions will be assigned later
@@ -119,8 +119,9 @@ class PasswordResetCompleteView(TemplateView):
 def profile_view(request):
     """User profile view showing account details and group membership."""
     user = request.user
-    groups = user.groups.all()
-    is_editor = groups.filter(name='Editors').exists()
+    # Fetch the groups once and derive the editor flag from them in memory
+    groups = list(user.groups.all())
+    is_editor = any(group.name == 'Editors' for group in groups)
     
     context = {
         'user': user,
@@ -3,7 +3,22 @@ import os
 
 
 bind = "0.0.0.0:8000"
-workers = int(os.getenv("WORKERS", multiprocessing.cpu_count() * 2 + 1))
+# One process per core; threads cover requests blocked on Postgres or OSRM
+workers = int(os.getenv("WORKERS", max(2, multiprocessing.cpu_count())))
+worker_class = "gthread"
+threads = int(os.getenv("THREADS", "4"))
+# Load Django and GEOS once in the master so forked workers share those pages
+preload_app = True
+# Recycle workers periodically to bound memory growth
+max_requests = int(os.getenv("MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", "100"))
 timeout = int(os.getenv("TIMEOUT", "60"))
 accesslog = "-"
 errorlog = "-"
+
+
+def post_fork(server, worker):
+    # Never share a database connection opened in the preloaded master
+    from django.db import connections
+
+    connections.close_all()
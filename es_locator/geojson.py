@@ -0,0 +1,48 @@
+"""
+Shared support for GeoJSON rendered by PostGIS.
+
+Spatial read endpoints annotate ``ST_AsGeoJSON`` output onto their querysets
+so geometries are never loaded into GEOS; serializers copy that text into
+each feature.
+"""
+import orjson
+
+
+# Decimal places kept in GeoJSON coordinates (~0.1m), below map display precision
+GEOJSON_PRECISION = 6
+
+# Queryset annotation holding a row's ST_AsGeoJSON output
+GEOJSON_ANNOTATION = 'geom_json'
+
+# Distinguishes "not annotated" from an annotated NULL geometry
+_NOT_ANNOTATED = object()
+
+
+class AnnotatedGeometryMixin:
+    """
+    Emit a GeoFeatureModelSerializer feature from a ``geom_json`` annotation.
+    
+    When the queryset carries the annotation, the geometry is copied from the
+    PostGIS string (or emitted as ``None`` for rows without one), so the
+    deferred geometry column is never loaded. Other properties still go
+    through the declared fields. Unannotated instances serialize as usual.
+    """
+    
+    def to_representation(self, instance):
+        geom_json = getattr(instance, GEOJSON_ANNOTATION, _NOT_ANNOTATED)
+        if geom_json is _NOT_ANNOTATED:
+            return super().to_representation(instance)
+        
+        properties = {}
+        for field in self._readable_fields:
+            if field.field_name in (self.Meta.geo_field, 'id'):
+                continue
+            attribute = field.get_attribute(instance)
+            properties[field.field_name] = None if attribute is None else field.to_representation(attribute)
+        
+        return {
+            'id': instance.id,
+            'type': 'Feature',
+            'geometry': None if geom_json is None else orjson.loads(geom_json),
+            'properties': properties,
+        }
@@ -0,0 +1,23 @@
+"""
+Additional REST framework renderers.
+
+MessagePack is offered as a compact binary alternative to JSON for clients
+that send ``Accept: application/vnd.msgpack`` (or ``?format=msgpack``).
+"""
+import msgpack
+from rest_framework.renderers import BaseRenderer
+
+
+class MessagePackRenderer(BaseRenderer):
+    """Render API responses as MessagePack."""
+
+    media_type = 'application/vnd.msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        # Anything msgpack cannot encode natively (Decimal, lazy strings) is sent as text
+        return msgpack.packb(data, default=str)
@@ -50,6 +50,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Adds ETags and answers If-None-Match with 304 for unchanged responses
+    'django.middleware.http.ConditionalGetMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -91,6 +93,19 @@ CHANNEL_LAYERS = {
     },
 }
 
+# Cache configuration
+# Redis (a separate database from the channel layer) is shared by every
+# worker, so cache invalidation in one process is seen by all of them; the
+# local-memory fallback is per process and only suits single-process development
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': f"redis://{os.getenv('REDIS_HOST', 'redis')}:{os.getenv('REDIS_PORT', 6379)}/1",
+    } if os.getenv('REDIS_HOST') else {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+
 # OSRM Routing configuration
 OSRM_URL = os.getenv('OSRM_URL', 'https://router.project-osrm.org')
 ROUTING_TIMEOUT = int(os.getenv('ROUTING_TIMEOUT', '10'))
@@ -107,6 +122,14 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASS', 'postgres'),
         'HOST': os.getenv('DB_HOST', 'localhost'),
         'PORT': os.getenv('DB_PORT', '5432'),
+        # Keep connections open across requests; PostGIS session setup is not free
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '600')),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'application_name': 'es_locator',
+            # JIT compilation costs more than it saves on short spatial queries
+            'options': '-c jit=off',
+        },
     }
 }
 
@@ -161,6 +184,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
         'rest_framework.renderers.JSONRenderer',
+        'es_locator.renderers.MessagePackRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
@@ -8,11 +8,19 @@ Provides GeoJSON-based RESTful API with spatial query capabilities including:
 - County containment queries
 - Custom polygon queries
 """
-from typing import Optional
+import hashlib
+import time
 
-from django.contrib.gis.db.models.functions import Distance
+import orjson
+
+from django.contrib.gis.db.models.functions import AsGeoJSON, Distance
 from django.contrib.gis.geos import GEOSGeometry, Point
-from django.db.models import QuerySet
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count, Max, QuerySet, Subquery
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.cache import patch_cache_control, patch_vary_headers
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter
@@ -21,9 +29,12 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 
+from es_locator.geojson import GEOJSON_ANNOTATION, GEOJSON_PRECISION
+
+from .filters import FacilityFilterSet
 from .models import County, EmergencyFacility
 from .permissions import IsEditorOrReadOnly
-from .serializers import CountyGeoSerializer, FacilityGeoSerializer
+from .serializers import CountyGeoSerializer, CountySerializer, FacilityGeoSerializer
 from .validators import parse_positive_meters, validate_lat_lon
 
 
@@ -32,6 +43,41 @@ DEFAULT_NEAREST_LIMIT = 5
 MAX_NEAREST_LIMIT = 50
 DEFAULT_COVERAGE_RADIUS_M = 10000
 MAX_COVERAGE_RADIUS_M = 100000
+MAX_COVERAGE_CLUSTERS = 50
+
+# Spatial facility query results are cached briefly. A facility saved or
+# deleted through the ORM switches to a new cache version, seen by every
+# worker through the shared cache; bulk imports fire no signals, so their
+# results show up within the TTL
+FACILITY_QUERY_CACHE_TTL_S = 60
+FACILITY_CACHE_VERSION_KEY = 'facilities:version'
+
+# Read-only facility actions whose GeoJSON is rendered by PostGIS
+FACILITY_GEOJSON_ACTIONS = frozenset((
+    'list', 'within_radius', 'nearest', 'within_county', 'within_polygon', 'coverage_buffers',
+))
+
+# County names change yearly at most, so geometry-free listings are cacheable
+# for a day; boundary GeoJSON is cached server- and client-side for an hour
+COUNTY_CACHE_MAX_AGE_S = 86400
+COUNTY_GEOJSON_CACHE_TTL_S = 3600
+
+
+def _request_cache_digest(request: Request) -> str:
+    """Hash the absolute request URI (paginated payloads embed absolute links)."""
+    return hashlib.sha1(request.build_absolute_uri().encode()).hexdigest()
+
+
+def _facility_cache_version() -> int:
+    """Return the current facility cache version, initialising it if needed."""
+    return cache.get_or_set(FACILITY_CACHE_VERSION_KEY, time.time_ns, None)
+
+
+@receiver(post_save, sender=EmergencyFacility)
+@receiver(post_delete, sender=EmergencyFacility)
+def _bump_facility_cache_version(sender, **kwargs):
+    """Retire cached facility query results whenever a facility changes."""
+    cache.set(FACILITY_CACHE_VERSION_KEY, time.time_ns(), None)
 
 
 class CountyViewSet(viewsets.ReadOnlyModelViewSet):
@@ -45,11 +91,61 @@ class CountyViewSet(viewsets.ReadOnlyModelViewSet):
         GET /api/counties/
         GET /api/counties/?name_en=Dublin
         GET /api/counties/?iso_code=IE-D
+        GET /api/counties/?geometry=false
     """
     
-    queryset = County.objects.all().order_by('name_en')
+    # GeoJSON is rendered by PostGIS; the raw geometry column is never loaded.
+    # Boundaries are served as stored: import_counties already simplifies them
+    queryset = County.objects.defer('geom').annotate(
+        **{GEOJSON_ANNOTATION: AsGeoJSON('geom', precision=GEOJSON_PRECISION)},
+    ).order_by('name_en')
     serializer_class = CountyGeoSerializer
     filterset_fields = ['iso_code', 'name_en']
+    
+    def _include_geometry(self) -> bool:
+        """Return False when the client asked for names only (?geometry=false)."""
+        value = self.request.query_params.get('geometry', '')
+        return value.lower() not in ('false', '0', 'no')
+    
+    def get_queryset(self):
+        if not self._include_geometry():
+            return County.objects.only('id', 'name_en', 'name_local', 'iso_code').order_by('name_en')
+        return super().get_queryset()
+    
+    def get_serializer_class(self):
+        if not self._include_geometry():
+            return CountySerializer
+        return super().get_serializer_class()
+    
+    def list(self, request, *args, **kwargs):
+        """
+        List counties, reusing serialized GeoJSON between requests.
+        
+        The cache key includes a cheap MAX(updated_at)/COUNT(*) probe, so
+        upserted boundaries, new counties and deletions are all picked up on
+        the next request. Clients may still hold a copy for the max-age.
+        """
+        if not self._include_geometry():
+            return super().list(request, *args, **kwargs)
+        
+        probe = County.objects.aggregate(last=Max('updated_at'), total=Count('id'))
+        last = probe['last'].timestamp() if probe['last'] else 0
+        cache_key = f"counties:v2:{last}:{probe['total']}:{_request_cache_digest(request)}"
+        
+        data = cache.get(cache_key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(cache_key, data, COUNTY_GEOJSON_CACHE_TTL_S)
+        return Response(data)
+    
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            max_age = COUNTY_GEOJSON_CACHE_TTL_S if self._include_geometry() else COUNTY_CACHE_MAX_AGE_S
+            patch_cache_control(response, public=True, max_age=max_age)
+            # Shared caches must keep renderer (JSON/msgpack) and encoding variants apart
+            patch_vary_headers(response, ['Accept', 'Accept-Encoding'])
+        return response
 
 
 class FacilityViewSet(viewsets.ModelViewSet):
@@ -67,7 +163,7 @@ class FacilityViewSet(viewsets.ModelViewSet):
     queryset = EmergencyFacility.objects.all()
     serializer_class = FacilityGeoSerializer
     filter_backends = [DjangoFilterBackend, OrderingFilter]
-    filterset_fields = ['type']
+    filterset_class = FacilityFilterSet
     ordering_fields = ['name', 'updated_at']
     
     def get_permissions(self):
@@ -81,6 +177,15 @@ class FacilityViewSet(viewsets.ModelViewSet):
             return [IsAuthenticated(), IsEditorOrReadOnly()]
         return [AllowAny()]
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in FACILITY_GEOJSON_ACTIONS:
+            # Spatial filters still use geom in SQL; only its transfer is skipped
+            queryset = queryset.defer('geom', 'geog').annotate(
+                **{GEOJSON_ANNOTATION: AsGeoJSON('geom', precision=GEOJSON_PRECISION)},
+            )
+        return queryset
+
     def _filtered_queryset(self) -> QuerySet:
         """
         Apply DRF filter backends to support ?type= query param for custom actions.
@@ -109,18 +214,27 @@ class FacilityViewSet(viewsets.ModelViewSet):
             request.query_params.get('lon'),
         )
         radius_m = parse_positive_meters(request.query_params.get('radius_m'))
-        point = Point(float(lon), float(lat), srid=4326)
+
+        cache_key = f'facilities:within-radius:{_facility_cache_version()}:{_request_cache_digest(request)}'
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+
+        point = Point(lon, lat, srid=4326)
         qs = (
             self._filtered_queryset()
-            .filter(geom__distance_lte=(point, radius_m))
+            .within_radius(point, radius_m)
             .annotate(distance=Distance('geom', point))
             .order_by('distance')
         )
         page = self.paginate_queryset(qs)
         serializer = self.get_serializer(page or qs, many=True)
         if page is not None:
-            return self.get_paginated_response(serializer.data)
-        return Response(serializer.data)
+            response = self.get_paginated_response(serializer.data)
+        else:
+            response = Response(serializer.data)
+        cache.set(cache_key, response.data, FACILITY_QUERY_CACHE_TTL_S)
+        return response
 
     @action(detail=False, methods=['get'], url_path='nearest')
     def nearest(self, request: Request) -> Response:
@@ -148,12 +262,8 @@ class FacilityViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         limit = max(1, min(limit, MAX_NEAREST_LIMIT))
-        point = Point(float(lon), float(lat), srid=4326)
-        qs = (
-            self._filtered_queryset()
-            .annotate(distance=Distance('geom', point))
-            .order_by('distance')[:limit]
-        )
+        point = Point(lon, lat, srid=4326)
+        qs = self._filtered_queryset().knn_nearest(point, limit)
         serializer = self.get_serializer(qs, many=True)
         return Response(serializer.data)
 
@@ -175,20 +285,20 @@ class FacilityViewSet(viewsets.ModelViewSet):
         county_id = request.query_params.get('id')
         county_name = request.query_params.get('name')
 
-        county: Optional[County] = None
         if county_id:
             try:
-                county = County.objects.get(pk=int(county_id))
-            except (County.DoesNotExist, ValueError):
-                return Response({'detail': 'County not found.'}, status=status.HTTP_404_NOT_FOUND)
+                county = County.objects.filter(pk=int(county_id))
+            except ValueError:
+                county = County.objects.none()
         elif county_name:
-            county = County.objects.filter(name_en__iexact=county_name).first()
-            if not county:
-                return Response({'detail': 'County not found.'}, status=status.HTTP_404_NOT_FOUND)
+            county = County.objects.filter(name_en__iexact=county_name)
         else:
             return Response({'detail': 'Provide county id or name parameter.'}, status=status.HTTP_400_BAD_REQUEST)
+        if not county.exists():
+            return Response({'detail': 'County not found.'}, status=status.HTTP_404_NOT_FOUND)
 
-        qs = self._filtered_queryset().filter(geom__within=county.geom)
+        # The boundary is matched by subquery, so it never leaves the database
+        qs = self._filtered_queryset().filter(geom__within=Subquery(county.values('geom')[:1]))
         page = self.paginate_queryset(qs)
         serializer = self.get_serializer(page or qs, many=True)
         if page is not None:
@@ -218,7 +328,8 @@ class FacilityViewSet(viewsets.ModelViewSet):
             if isinstance(geom_payload, str):
                 polygon = GEOSGeometry(geom_payload, srid=4326)
             else:
-                polygon = GEOSGeometry(str(geom_payload), srid=4326)
+                # Encode the parsed GeoJSON mapping back to JSON text for GEOS
+                polygon = GEOSGeometry(orjson.dumps(geom_payload).decode(), srid=4326)
         except Exception:
             return Response({'detail': 'Invalid geometry.'}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -249,9 +360,11 @@ class FacilityViewSet(viewsets.ModelViewSet):
             lon: Longitude of center point
             radius_m (optional): Radius in meters (default 10km, max 100km)
             type (optional): Filter by facility type
+            cluster (optional): Group facilities into this many k-means clusters (1-50)
             
         Returns:
-            JSON object with radius_m and results array of facilities with distances
+            JSON object with radius_m and results array of facilities with distances,
+            or of cluster centroids with facility counts when cluster is given
         """
         lat, lon = validate_lat_lon(
             request.query_params.get('lat'),
@@ -262,12 +375,65 @@ class FacilityViewSet(viewsets.ModelViewSet):
             default=DEFAULT_COVERAGE_RADIUS_M,
             maxv=MAX_COVERAGE_RADIUS_M,
         )
-        point = Point(float(lon), float(lat), srid=4326)
+        point = Point(lon, lat, srid=4326)
+
+        if request.query_params.get('cluster') is not None:
+            try:
+                clusters = int(request.query_params['cluster'])
+            except ValueError:
+                return Response(
+                    {'detail': 'Cluster must be an integer.'},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            clusters = max(1, min(clusters, MAX_COVERAGE_CLUSTERS))
+            return Response({
+                'radius_m': radius_m,
+                'results': self._cluster_features(point, radius_m, clusters),
+            })
+
         qs = (
             self._filtered_queryset()
-            .filter(geom__distance_lte=(point, radius_m))
+            .within_radius(point, radius_m)
             .annotate(distance=Distance('geom', point))
             .order_by('distance')
         )
         serializer = self.get_serializer(qs, many=True)
         return Response({'radius_m': radius_m, 'results': serializer.data})
+
+    def _cluster_features(self, point: Point, radius_m: float, clusters: int) -> dict:
+        """
+        Cluster facilities within a radius server-side with ST_ClusterKMeans.
+        
+        Args:
+            point: Center point (GEOS Point with SRID 4326)
+            radius_m: Radius in meters
+            clusters: Number of k-means clusters
+            
+        Returns:
+            GeoJSON FeatureCollection of cluster centroids with facility counts
+        """
+        inner = self._filtered_queryset().within_radius(point, radius_m).order_by().values('geom')
+        inner_sql, inner_params = inner.query.sql_with_params()
+        # PostGIS rejects K larger than the row count, so K is capped at
+        # COUNT(*) OVER () computed one level down (window calls cannot nest)
+        sql = (
+            'SELECT cluster, ST_AsGeoJSON(ST_Centroid(ST_Collect(geom)), %s), COUNT(*) '
+            'FROM (SELECT ST_ClusterKMeans(geom, LEAST(%s, total)::integer) OVER () AS cluster, geom '
+            'FROM (SELECT geom, COUNT(*) OVER () AS total '
+            f'FROM ({inner_sql}) AS facilities) AS counted) AS clustered '
+            'GROUP BY cluster ORDER BY cluster'
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [GEOJSON_PRECISION, clusters, *inner_params])
+            rows = cursor.fetchall()
+        return {
+            'type': 'FeatureCollection',
+            'features': [
+                {
+                    'type': 'Feature',
+                    'geometry': orjson.loads(centroid),
+                    'properties': {'cluster': cluster, 'count': count},
+                }
+                for cluster, centroid, count in rows
+            ],
+        }
@@ -0,0 +1,17 @@
+"""
+FilterSets for facility API endpoints.
+
+Declared once at import; DjangoFilterBackend would otherwise build an
+equivalent FilterSet class from ``filterset_fields`` on every request.
+"""
+import django_filters
+
+from .models import EmergencyFacility
+
+
+class FacilityFilterSet(django_filters.FilterSet):
+    """Filter facilities by type (?type=hospital)."""
+
+    class Meta:
+        model = EmergencyFacility
+        fields = ['type']
@@ -7,18 +7,189 @@ Usage:
     python manage.py import_counties
     python manage.py import_counties --source=osm
     python manage.py import_counties --clear
+    python manage.py import_counties --ignore-cache
+    python manage.py import_counties --source=geojson --url=<URL> --fast
+    python manage.py import_counties --simplify-tolerance=0
 """
 
-import requests
+import csv
+import hashlib
+import io
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+
+import ijson
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from django.conf import settings
 from django.core.management.base import BaseCommand
-from django.contrib.gis.geos import GEOSGeometry, MultiPolygon
-from django.db import transaction
+from django.contrib.gis.geos import MultiPolygon, Polygon
+from django.db import DatabaseError, connection, transaction
 from facilities.models import County
 
+# Rows per multi-row INSERT when upserting counties
+BULK_BATCH_SIZE = 500
+
+NOMINATIM_URL = 'https://nominatim.openstreetmap.org/search'
+
+# Nominatim usage policy allows at most one request per second
+NOMINATIM_MIN_INTERVAL_S = 1.0
+
+# Concurrent lookups; the shared rate limiter still caps the request rate
+NOMINATIM_WORKERS = 2
+
+# Raw Nominatim responses are cached here so re-runs skip the network
+NOMINATIM_CACHE_DIR = settings.BASE_DIR / '.cache' / 'nominatim'
+
+# Default simplification tolerance in degrees (~100m at Irish latitudes)
+DEFAULT_SIMPLIFY_TOLERANCE = 0.001
+
+# GeoJSON geometry types a county boundary can be built from
+POLYGONAL_TYPES = ('Polygon', 'MultiPolygon')
+
+# COPY marker for NULL; an unquoted empty CSV field then loads as ''
+COPY_NULL = r'\N'
+
+# GiST index Django creates for County.geom (dropped and rebuilt by --fast)
+COUNTY_GEOM_INDEX = f'{County._meta.db_table}_geom_id'
+
+
+class CountyLookupError(Exception):
+    """Raised when Nominatim returns no usable boundary for a county."""
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing calls at least ``interval`` seconds apart."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.next_allowed = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        # Reserve the next slot under the lock, then sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self.next_allowed)
+            self.next_allowed = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class InvalidGeoJSON(Exception):
+    """Raised when a streamed document is not a GeoJSON FeatureCollection."""
+
+
+def _iter_features(stream):
+    """
+    Yield features from a GeoJSON FeatureCollection one at a time.
+    
+    Parses incrementally with ijson instead of loading the whole document.
+    The top-level ``type`` member is checked as it streams past; a
+    non-FeatureCollection raises InvalidGeoJSON so the caller's
+    transaction rolls back any batches already written.
+    """
+    def checked_events():
+        for prefix, event, value in ijson.parse(stream, use_float=True):
+            if prefix == 'type' and event == 'string' and value != 'FeatureCollection':
+                raise InvalidGeoJSON('Invalid GeoJSON: not a FeatureCollection')
+            yield prefix, event, value
+
+    return ijson.items(checked_events(), 'features.item')
+
+
+def _bbox_area(feature: dict) -> float:
+    """Return a feature's bounding-box area in square degrees (0 if unknown)."""
+    bbox = feature.get('bbox')
+    if bbox and len(bbox) == 4:
+        west, south, east, north = bbox
+    else:
+        # Nominatim's json format uses [south, north, west, east] strings
+        bbox = feature.get('boundingbox') or feature.get('properties', {}).get('boundingbox')
+        if not bbox:
+            return 0.0
+        south, north, west, east = map(float, bbox)
+    return (north - south) * (east - west)
+
+
+def _multipolygon_from_geojson(geometry: dict) -> MultiPolygon:
+    """
+    Build a MultiPolygon straight from a GeoJSON geometry mapping.
+    
+    Polygon and MultiPolygon coordinates are handed to GEOS directly, avoiding
+    a dict -> text -> GEOS parse round trip per feature.
+    
+    Raises:
+        ValueError: If the geometry is not a Polygon or MultiPolygon
+    """
+    geom_type = geometry['type']
+    if geom_type == 'Polygon':
+        return MultiPolygon(Polygon(*geometry['coordinates']), srid=4326)
+    if geom_type == 'MultiPolygon':
+        return MultiPolygon(*[Polygon(*rings) for rings in geometry['coordinates']], srid=4326)
+    raise ValueError(f'Expected a Polygon or MultiPolygon, got {geom_type}')
+
+
+def _dedupe_by_iso_code(counties):
+    """
+    Keep only the last County for each ISO code in a batch.
+    
+    Postgres rejects an ON CONFLICT DO UPDATE that touches the same row
+    twice in one statement. Counties without a code are stored as NULL and
+    never conflict, so they are all kept.
+    """
+    by_code = {}
+    uncoded = []
+    for county in counties:
+        if county.iso_code is None:
+            uncoded.append(county)
+        else:
+            by_code[county.iso_code] = county
+    return [*by_code.values(), *uncoded]
+
+
+def _simplify(geom: MultiPolygon, tolerance: float) -> MultiPolygon:
+    """
+    Simplify a boundary while keeping it a valid MultiPolygon.
+    
+    A tolerance of 0 returns the geometry unchanged.
+    """
+    if not tolerance:
+        return geom
+    simplified = geom.simplify(tolerance, preserve_topology=True)
+    if simplified.geom_type == 'Polygon':
+        simplified = MultiPolygon(simplified, srid=4326)
+    return simplified
+
+
+def _nominatim_session(pool_connections: int = 1) -> requests.Session:
+    """
+    Build a keep-alive session with retry/backoff for Nominatim.
+    
+    Args:
+        pool_connections: Number of hosts to keep connection pools for
+    """
+    session = requests.Session()
+    session.headers['User-Agent'] = 'EmergencyServicesLocator/1.0'
+    retries = Retry(
+        total=3,
+        backoff_factor=1.5,
+        status_forcelist=[429, 502, 503, 504],
+        respect_retry_after_header=True,
+    )
+    session.mount('https://', HTTPAdapter(pool_connections=pool_connections, pool_maxsize=4, max_retries=retries))
+    return session
+
 
 class Command(BaseCommand):
     help = 'Import Irish county boundaries from open data APIs'
+    fast = False
+    session = None
+    simplify_tolerance = DEFAULT_SIMPLIFY_TOLERANCE
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -38,6 +209,22 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing counties before importing',
         )
+        parser.add_argument(
+            '--ignore-cache',
+            action='store_true',
+            help='Re-fetch Nominatim responses instead of reading the local cache',
+        )
+        parser.add_argument(
+            '--fast',
+            action='store_true',
+            help='Bulk-load mode: load via COPY, rebuild the spatial index afterwards and relax commit durability',
+        )
+        parser.add_argument(
+            '--simplify-tolerance',
+            type=float,
+            default=DEFAULT_SIMPLIFY_TOLERANCE,
+            help='Simplify boundaries to this tolerance in degrees before storing (0 = off)',
+        )
 
     def handle(self, *args, **options):
         if options['clear']:
@@ -46,20 +233,50 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING(f'Deleted {count} existing counties'))
 
         source = options['source']
+        self.fast = options['fast']
+        # Callers invoking handle() directly may share an existing HTTP session
+        self.session = options.get('session')
+        self.simplify_tolerance = options['simplify_tolerance']
         
-        if source == 'osm':
-            self.import_from_osm()
-        elif source == 'geojson':
-            url = options['url']
-            if not url:
-                self.stderr.write(self.style.ERROR('--url is required when using --source=geojson'))
-                return
-            self.import_from_geojson(url)
-
-    def import_from_osm(self):
+        if source == 'geojson' and not options['url']:
+            self.stderr.write(self.style.ERROR('--url is required when using --source=geojson'))
+            return
+
+        with self._deferred_spatial_index():
+            if source == 'osm':
+                self.import_from_osm(use_cache=not options['ignore_cache'])
+            elif source == 'geojson':
+                self.import_from_geojson(options['url'])
+
+    @contextmanager
+    def _deferred_spatial_index(self):
+        """
+        In --fast mode, drop the county GiST index for the load and rebuild it once.
+        
+        Maintaining a GiST index row by row is the most expensive part of a
+        geometry INSERT; a single CREATE INDEX over the loaded table is far
+        cheaper. The index is rebuilt even if the import fails.
+        """
+        if not self.fast:
+            yield
+            return
+        table = connection.ops.quote_name(County._meta.db_table)
+        index = connection.ops.quote_name(COUNTY_GEOM_INDEX)
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP INDEX IF EXISTS {index}')
+        try:
+            yield
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute(f'CREATE INDEX IF NOT EXISTS {index} ON {table} USING GIST (geom)')
+
+    def import_from_osm(self, use_cache=True):
         """
         Import counties using OpenStreetMap Nominatim API.
         This fetches simplified boundaries for Irish counties.
+        
+        Responses are cached on disk under NOMINATIM_CACHE_DIR; pass
+        use_cache=False to force fresh lookups (the cache is still refreshed).
         """
         self.stdout.write('Fetching Irish counties from OpenStreetMap...')
         
@@ -93,91 +310,30 @@ class Command(BaseCommand):
             {'name': 'Leitrim', 'local': 'Liatroim', 'code': 'IE-LM'},
         ]
 
-        created_count = 0
+        to_upsert = []
         failed_count = 0
+        session = self.session or _nominatim_session()
+        rate_limiter = RateLimiter(NOMINATIM_MIN_INTERVAL_S)
+        NOMINATIM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
-        with transaction.atomic():
-            for idx, county_data in enumerate(counties, start=1):
+        # Fetch everything first so the transaction is not held open during HTTP waits.
+        # Two workers overlap one request's transfer/parse with the next one's
+        # rate-limit wait; the shared limiter keeps us within Nominatim's policy.
+        with ThreadPoolExecutor(max_workers=NOMINATIM_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    self._fetch_county, session, rate_limiter, county_data, use_cache
+                ): county_data
+                for county_data in counties
+            }
+            for future in as_completed(futures):
+                county_data = futures[future]
                 try:
-                    # Query Nominatim for the county boundary
-                    params = {
-                        'q': f"County {county_data['name']}, Ireland",
-                        'format': 'geojson',
-                        'polygon_geojson': 1,
-                        'limit': 5,
-                    }
-                    response = requests.get(
-                        'https://nominatim.openstreetmap.org/search',
-                        params=params,
-                        headers={'User-Agent': 'EmergencyServicesLocator/1.0'},
-                        timeout=10
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-
-                    if not data.get('features'):
-                        self.stderr.write(
-                            self.style.WARNING(f"No data found for {county_data['name']}")
-                        )
-                        failed_count += 1
-                        continue
-
-                    # Find the best result (largest area with type=administrative)
-                    best_feature = None
-                    best_area = 0
-                    
-                    for feature in data['features']:
-                        props = feature.get('properties', {})
-                        geometry = feature.get('geometry')
-                        
-                        if geometry and props.get('type') in ['administrative', 'boundary']:
-                            geom = GEOSGeometry(str(geometry))
-                            if geom.area > best_area and geom.area > 0.01:
-                                best_area = geom.area
-                                best_feature = feature
-                    
-                    if not best_feature:
-                        best_feature = data['features'][0]
-                        geometry = best_feature.get('geometry')
-                        if not geometry:
-                            self.stderr.write(
-                                self.style.WARNING(f"No geometry for {county_data['name']}")
-                            )
-                            failed_count += 1
-                            continue
-                    
-                    geometry = best_feature.get('geometry')
-                    if not geometry:
-                        self.stderr.write(
-                            self.style.WARNING(f"No geometry for {county_data['name']}")
-                        )
-                        failed_count += 1
-                        continue
-
-                    # Convert to GEOS geometry and ensure it's MultiPolygon
-                    geom = GEOSGeometry(str(geometry))
-                    if geom.geom_type == 'Polygon':
-                        geom = MultiPolygon(geom)
-
-                    # Update or create county
-                    County.objects.update_or_create(
-                        iso_code=county_data['code'],
-                        defaults={
-                            'source_id': best_feature.get('place_id') or best_feature.get('properties', {}).get('place_id'),
-                            'name_en': county_data['name'],
-                            'name_local': county_data['local'],
-                            'geom': geom,
-                        }
-                    )
-                    
-                    created_count += 1
-                    self.stdout.write(
-                        self.style.SUCCESS(f"✓ {county_data['name']} ({created_count}/{len(counties)})")
-                    )
-                    
-                    # Rate limiting - be nice to OSM servers
-                    time.sleep(1.5)
-
+                    county = future.result()
+                except CountyLookupError as e:
+                    self.stderr.write(self.style.WARNING(str(e)))
+                    failed_count += 1
+                    continue
                 except Exception as e:
                     self.stderr.write(
                         self.style.ERROR(f"✗ Failed to import {county_data['name']}: {str(e)}")
@@ -185,36 +341,119 @@ class Command(BaseCommand):
                     failed_count += 1
                     continue
 
+                to_upsert.append(county)
+                self.stdout.write(
+                    self.style.SUCCESS(f"✓ {county_data['name']} ({len(to_upsert)}/{len(counties)})")
+                )
+
+        # Upsert all counties in one statement, keyed on the unique ISO code
+        try:
+            with transaction.atomic():
+                self._upsert_counties(to_upsert)
+        except DatabaseError as e:
+            self.stderr.write(self.style.ERROR(f'✗ Failed to save counties: {str(e)}'))
+            return
+
         self.stdout.write(
             self.style.SUCCESS(
-                f'\nImport complete: {created_count} counties imported, {failed_count} failed'
+                f'\nImport complete: {len(to_upsert)} counties imported, {failed_count} failed'
             )
         )
 
+    def _fetch_county(self, session, rate_limiter, county_data, use_cache=True):
+        """
+        Query Nominatim for one county and build an unsaved County.
+        
+        Runs in a worker thread, so it performs no database access.
+        
+        Raises:
+            CountyLookupError: If Nominatim returns no usable geometry
+        """
+        params = {
+            'q': f"County {county_data['name']}, Ireland",
+            'format': 'geojson',
+            'polygon_geojson': 1,
+            'limit': 5,
+        }
+        cache_key = hashlib.sha1(orjson.dumps(params, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        cache_file = NOMINATIM_CACHE_DIR / f'{cache_key}.json'
+
+        fetched = not (use_cache and cache_file.exists())
+        if fetched:
+            # Rate limiting - be nice to OSM servers
+            rate_limiter.wait()
+            response = session.get(NOMINATIM_URL, params=params, timeout=10)
+            response.raise_for_status()
+            content = response.content
+        else:
+            content = cache_file.read_bytes()
+        data = orjson.loads(content)
+
+        if not data.get('features'):
+            raise CountyLookupError(f"No data found for {county_data['name']}")
+
+        # Find the best result (largest administrative area) by bounding box,
+        # so only the chosen feature's geometry is ever built
+        candidates = (
+            feature for feature in data['features']
+            if feature.get('geometry')
+            and feature.get('properties', {}).get('type') in ('administrative', 'boundary')
+            and _bbox_area(feature) > 0.01
+        )
+        best_feature = max(candidates, key=_bbox_area, default=None) or data['features'][0]
+        
+        geometry = best_feature.get('geometry')
+        if not geometry:
+            raise CountyLookupError(f"No geometry for {county_data['name']}")
+        if geometry.get('type') not in POLYGONAL_TYPES:
+            raise CountyLookupError(
+                f"No boundary for {county_data['name']}: got a {geometry.get('type')}"
+            )
+
+        geom = _simplify(_multipolygon_from_geojson(geometry), self.simplify_tolerance)
+
+        # Only cache responses that produced a boundary, so a bad lookup is retried
+        if fetched:
+            cache_file.write_bytes(content)
+
+        return County(
+            source_id=best_feature.get('place_id') or best_feature.get('properties', {}).get('place_id'),
+            name_en=county_data['name'],
+            name_local=county_data['local'],
+            iso_code=county_data['code'],
+            geom=geom,
+        )
+
     def import_from_geojson(self, url):
-        """Import counties from a GeoJSON URL"""
+        """
+        Import counties from a GeoJSON URL.
+        
+        Features are streamed from the response and upserted in batches, so
+        memory use is bounded by the batch size rather than the file size.
+        """
         self.stdout.write(f'Fetching data from {url}...')
         
         try:
-            response = requests.get(url, timeout=30)
+            response = requests.get(url, stream=True, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            response.raw.decode_content = True
 
-            if data.get('type') != 'FeatureCollection':
-                self.stderr.write(self.style.ERROR('Invalid GeoJSON: not a FeatureCollection'))
-                return
-
-            features = data.get('features', [])
-            created_count = 0
+            to_upsert = []
+            imported_count = 0
 
             with transaction.atomic():
-                for idx, feature in enumerate(features, start=1):
+                for idx, feature in enumerate(_iter_features(response.raw), start=1):
                     try:
-                        props = feature.get('properties', {})
+                        props = feature.get('properties') or {}
                         geometry = feature.get('geometry')
 
                         if not geometry:
                             continue
+                        if geometry.get('type') not in POLYGONAL_TYPES:
+                            self.stderr.write(self.style.WARNING(
+                                f"Skipping feature {idx}: {geometry.get('type')} is not a boundary"
+                            ))
+                            continue
 
                         name = (props.get('NAME_TAG') or 
                                props.get('name') or 
@@ -222,19 +461,16 @@ class Command(BaseCommand):
                                props.get('COUNTYNAME') or
                                f'County {idx}')
 
-                        geom = GEOSGeometry(str(geometry))
-                        if geom.geom_type == 'Polygon':
-                            geom = MultiPolygon(geom)
+                        geom = _simplify(_multipolygon_from_geojson(geometry), self.simplify_tolerance)
 
-                        County.objects.create(
+                        # Missing ISO codes are stored as NULL so they never collide on upsert
+                        to_upsert.append(County(
                             source_id=props.get('id', f'geojson_{idx}'),
                             name_en=name,
                             name_local=props.get('name_local', ''),
-                            iso_code=props.get('iso_code', ''),
+                            iso_code=props.get('iso_code') or None,
                             geom=geom,
-                        )
-                        
-                        created_count += 1
+                        ))
                         self.stdout.write(self.style.SUCCESS(f"✓ {name}"))
 
                     except Exception as e:
@@ -243,9 +479,87 @@ class Command(BaseCommand):
                         )
                         continue
 
+                    if len(to_upsert) >= BULK_BATCH_SIZE:
+                        self._upsert_counties(to_upsert)
+                        imported_count += len(to_upsert)
+                        to_upsert = []
+
+                self._upsert_counties(to_upsert)
+                imported_count += len(to_upsert)
+
             self.stdout.write(
-                self.style.SUCCESS(f'\nImported {created_count} counties from GeoJSON')
+                self.style.SUCCESS(f'\nImported {imported_count} counties from GeoJSON')
             )
 
+        except InvalidGeoJSON as e:
+            self.stderr.write(self.style.ERROR(str(e)))
         except Exception as e:
             self.stderr.write(self.style.ERROR(f'Failed to fetch GeoJSON: {str(e)}'))
+
+    def _upsert_counties(self, counties):
+        """Insert or update counties in batched multi-row statements keyed on ISO code."""
+        counties = _dedupe_by_iso_code(counties)
+        if self.fast and connection.vendor == 'postgresql':
+            # Skip waiting for the WAL flush on commit for this transaction only
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL synchronous_commit = off')
+            self._copy_upsert_counties(counties)
+            return
+        County.objects.bulk_create(
+            counties,
+            batch_size=BULK_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['iso_code'],
+            update_fields=['source_id', 'name_en', 'name_local', 'geom', 'updated_at'],
+        )
+
+    def _copy_upsert_counties(self, counties):
+        """
+        Upsert counties through COPY into a temporary staging table.
+        
+        COPY skips per-row SQL parsing and parameter binding. Geometries are
+        sent as hex EWKB, which needs no CSV escaping. COPY itself cannot
+        resolve conflicts, so rows are merged from the staging table with a
+        single INSERT ... ON CONFLICT (iso_code) DO UPDATE.
+        """
+        if not counties:
+            return
+
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for county in counties:
+            # None is written as COPY_NULL so empty strings load as '' like bulk_create
+            writer.writerow([
+                COPY_NULL if value is None else value
+                for value in (
+                    county.source_id,
+                    county.name_en,
+                    county.name_local,
+                    county.iso_code,
+                    county.geom.hexewkb.decode(),
+                )
+            ])
+        buf.seek(0)
+
+        table = connection.ops.quote_name(County._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'CREATE TEMP TABLE IF NOT EXISTS county_load ('
+                'source_id varchar(100), name_en varchar(100), name_local varchar(100), '
+                'iso_code varchar(10), geom geometry(MultiPolygon, 4326)'
+                ') ON COMMIT DROP'
+            )
+            cursor.copy_expert(
+                'COPY county_load (source_id, name_en, name_local, iso_code, geom) '
+                f"FROM STDIN WITH (FORMAT CSV, NULL '{COPY_NULL}')",
+                buf,
+            )
+            cursor.execute(
+                f'INSERT INTO {table} (source_id, name_en, name_local, iso_code, geom) '
+                'SELECT source_id, name_en, name_local, iso_code, geom FROM county_load '
+                'ON CONFLICT (iso_code) DO UPDATE SET '
+                'source_id = EXCLUDED.source_id, name_en = EXCLUDED.name_en, '
+                'name_local = EXCLUDED.name_local, geom = EXCLUDED.geom, updated_at = now()'
+            )
+            # The staging table lives until commit; empty it for the next batch
+            cursor.execute('TRUNCATE county_load')
@@ -14,6 +14,7 @@ Usage:
     python manage.py import_facilities --clear
 """
 
+import orjson
 import requests
 import time
 from django.core.management.base import BaseCommand
@@ -24,6 +25,7 @@ from facilities.models import EmergencyFacility
 
 class Command(BaseCommand):
     help = 'Import emergency facilities from open data APIs'
+    session = None
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -74,6 +76,8 @@ class Command(BaseCommand):
 
         facility_types = options['types'].split(',')
         source = options['source']
+        # Callers invoking handle() directly may share an existing HTTP session
+        self.session = options.get('session')
 
         if source == 'osm':
             self.import_from_osm(facility_types, options)
@@ -144,13 +148,13 @@ class Command(BaseCommand):
                 """
 
             try:
-                response = requests.post(
+                response = (self.session or requests).post(
                     'https://overpass-api.de/api/interpreter',
                     data={'data': query},
                     timeout=120
                 )
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
 
                 elements = data.get('elements', [])
                 limit = options.get('limit')
@@ -242,9 +246,9 @@ class Command(BaseCommand):
         self.stdout.write(f'Fetching data from {url}...')
         
         try:
-            response = requests.get(url, timeout=30)
+            response = (self.session or requests).get(url, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if data.get('type') != 'FeatureCollection':
                 self.stderr.write(self.style.ERROR('Invalid GeoJSON: not a FeatureCollection'))
@@ -0,0 +1,79 @@
+"""
+Seed the database with Irish county boundaries and emergency facilities.
+
+Runs import_counties and import_facilities in-process, sharing one HTTP
+session between them. The two imports write to disjoint tables, so they run
+concurrently.
+
+Usage:
+    python manage.py seed_database
+    python manage.py seed_database --clear
+    python manage.py seed_database --limit=10
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from facilities.management.commands import import_counties, import_facilities
+
+
+class Command(BaseCommand):
+    help = 'Seed counties and emergency facilities from OpenStreetMap'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help='Clear existing counties and facilities before importing',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            help='Maximum number of facilities to import per type',
+        )
+
+    def handle(self, *args, **options):
+        # One pool per host: Nominatim for counties, Overpass for facilities
+        session = import_counties._nominatim_session(pool_connections=2)
+
+        # Options are passed straight to handle(), skipping argparse, so
+        # every key each command reads must be present here
+        county_options = {
+            'source': 'osm',
+            'url': None,
+            'clear': options['clear'],
+            'ignore_cache': False,
+            'fast': False,
+            'simplify_tolerance': import_counties.DEFAULT_SIMPLIFY_TOLERANCE,
+            'session': session,
+        }
+        facility_options = {
+            'source': 'osm',
+            'types': 'hospital,fire_station,police_station,ambulance_base',
+            'country': 'ireland',
+            'bbox': None,
+            'url': None,
+            'clear': options['clear'],
+            'limit': options['limit'],
+            'session': session,
+        }
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self._run, import_counties.Command, county_options),
+                executor.submit(self._run, import_facilities.Command, facility_options),
+            ]
+            for future in futures:
+                future.result()
+
+        self.stdout.write(self.style.SUCCESS('\n✓ Database seeded'))
+
+    def _run(self, command_class, options):
+        """Run one import command in a worker thread."""
+        try:
+            command_class(stdout=self.stdout, stderr=self.stderr).handle(**options)
+        finally:
+            # Each worker thread opens its own database connection
+            connection.close()
@@ -0,0 +1,23 @@
+"""
+Add a multicolumn GiST index on (type, geom) for type-filtered spatial queries.
+
+btree_gist provides the GiST operator class for the varchar type column.
+"""
+from django.contrib.postgres.indexes import GistIndex
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facilities', '0001_initial'),
+    ]
+
+    operations = [
+        BtreeGistExtension(),
+        migrations.AddIndex(
+            model_name='emergencyfacility',
+            index=GistIndex(fields=['type', 'geom'], name='facility_type_geom_gix'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+"""
+Add a stored geography copy of EmergencyFacility.geom with its own GiST index.
+
+Meter-based radius filters run ST_DWithin on this column directly instead of
+casting geom to geography for every row.
+"""
+import django.contrib.gis.db.models.fields
+from django.contrib.postgres.indexes import GistIndex
+from django.db import migrations, models
+from django.db.models.functions import Cast
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facilities', '0002_facility_type_geom_gix'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emergencyfacility',
+            name='geog',
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=Cast(
+                    'geom',
+                    output_field=django.contrib.gis.db.models.fields.PointField(geography=True, srid=4326),
+                ),
+                output_field=django.contrib.gis.db.models.fields.PointField(geography=True, srid=4326),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='emergencyfacility',
+            index=GistIndex(fields=['geog'], name='facility_geog_gix'),
+        ),
+    ]
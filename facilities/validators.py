@@ -4,9 +4,16 @@ Input validation utilities for API endpoints.
 Provides consistent validation and error handling for geographic coordinates
 and other numeric parameters.
 """
+import math
+
 from rest_framework.exceptions import ValidationError
 
 
+# Coordinate bounds; integers keep error text as "Must be ≥ -90."
+LAT_RANGE = (-90, 90)
+LON_RANGE = (-180, 180)
+
+
 def parse_float(name: str, value, minv: float = None, maxv: float = None) -> float:
     """
     Parse a value to float with optional range validation.
@@ -21,12 +28,18 @@ def parse_float(name: str, value, minv: float = None, maxv: float = None) -> flo
         Parsed float value
         
     Raises:
-        ValidationError: If value is not a valid number or out of range
+        ValidationError: If value is not a valid number, is NaN, or is out of range
     """
     try:
         x = float(value)
     except (TypeError, ValueError):
         raise ValidationError({name: "Must be a number."})
+    # Fast path: a single chained comparison when both bounds are given;
+    # NaN fails it and is rejected below
+    if minv is not None and maxv is not None and minv <= x <= maxv:
+        return x
+    if math.isnan(x):
+        raise ValidationError({name: "Must not be NaN."})
     if minv is not None and x < minv:
         raise ValidationError({name: f"Must be ≥ {minv}."})
     if maxv is not None and x > maxv:
@@ -49,8 +62,8 @@ def validate_lat_lon(lat, lon) -> tuple:
         ValidationError: If coordinates are invalid
     """
     return (
-        parse_float('lat', lat, -90, 90),
-        parse_float('lon', lon, -180, 180),
+        parse_float('lat', lat, *LAT_RANGE),
+        parse_float('lon', lon, *LON_RANGE),
     )
 
 
@@ -5,7 +5,69 @@ from django.contrib import admin
 from django.contrib.gis.admin import GISModelAdmin
 from django.utils.html import format_html
 
-from .models import Incident, Vehicle, VehicleAssignment, DispatcherProfile
+from .models import (
+    INCIDENT_PRIORITY_CHOICES,
+    INCIDENT_STATUS_CHOICES,
+    VEHICLE_STATUS_CHOICES,
+    DispatcherProfile,
+    Incident,
+    Vehicle,
+    VehicleAssignment,
+)
+
+
+# Badge colors, built once at import rather than on every changelist row
+BADGE_DEFAULT_COLOR = '#6c757d'
+
+PRIORITY_BADGE_COLORS = {
+    'critical': '#dc3545',
+    'high': '#fd7e14',
+    'medium': '#ffc107',
+    'low': '#28a745',
+}
+
+INCIDENT_STATUS_BADGE_COLORS = {
+    'pending': '#ffc107',
+    'dispatched': '#17a2b8',
+    'en_route': '#6f42c1',
+    'on_scene': '#007bff',
+    'resolved': '#28a745',
+    'cancelled': '#6c757d',
+}
+
+VEHICLE_STATUS_BADGE_COLORS = {
+    'available': '#28a745',
+    'dispatched': '#17a2b8',
+    'en_route': '#6f42c1',
+    'on_scene': '#007bff',
+    'returning': '#fd7e14',
+    'out_of_service': '#dc3545',
+    'maintenance': '#6c757d',
+}
+
+BADGE_TEMPLATE = (
+    '<span style="background-color: {}; color: white; padding: 2px 8px; '
+    'border-radius: 4px; font-size: 11px;">{}</span>'
+)
+
+
+def render_badge(color, label):
+    """Render a colored badge as safe HTML."""
+    return format_html(BADGE_TEMPLATE, color, label)
+
+
+def _prerender_badges(choices, colors, label=None):
+    """Render every badge of a closed choice set once, keyed by stored value."""
+    return {
+        value: render_badge(colors.get(value, BADGE_DEFAULT_COLOR), label(value) if label else display)
+        for value, display in choices
+    }
+
+
+# Badge HTML for every known choice; unknown values fall back to rendering per row
+PRIORITY_BADGES = _prerender_badges(INCIDENT_PRIORITY_CHOICES, PRIORITY_BADGE_COLORS, label=str.upper)
+INCIDENT_STATUS_BADGES = _prerender_badges(INCIDENT_STATUS_CHOICES, INCIDENT_STATUS_BADGE_COLORS)
+VEHICLE_STATUS_BADGES = _prerender_badges(VEHICLE_STATUS_CHOICES, VEHICLE_STATUS_BADGE_COLORS)
 
 
 @admin.register(Incident)
@@ -45,36 +107,18 @@ class IncidentAdmin(GISModelAdmin):
     )
     
     def priority_badge(self, obj):
-        colors = {
-            'critical': '#dc3545',
-            'high': '#fd7e14',
-            'medium': '#ffc107',
-            'low': '#28a745',
-        }
-        color = colors.get(obj.priority, '#6c757d')
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 2px 8px; '
-            'border-radius: 4px; font-size: 11px;">{}</span>',
-            color, obj.priority.upper()
-        )
+        badge = PRIORITY_BADGES.get(obj.priority)
+        if badge is None:
+            badge = render_badge(BADGE_DEFAULT_COLOR, obj.priority.upper())
+        return badge
     priority_badge.short_description = 'Priority'
     priority_badge.admin_order_field = 'priority'
     
     def status_badge(self, obj):
-        colors = {
-            'pending': '#ffc107',
-            'dispatched': '#17a2b8',
-            'en_route': '#6f42c1',
-            'on_scene': '#007bff',
-            'resolved': '#28a745',
-            'cancelled': '#6c757d',
-        }
-        color = colors.get(obj.status, '#6c757d')
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 2px 8px; '
-            'border-radius: 4px; font-size: 11px;">{}</span>',
-            color, obj.get_status_display()
-        )
+        badge = INCIDENT_STATUS_BADGES.get(obj.status)
+        if badge is None:
+            badge = render_badge(BADGE_DEFAULT_COLOR, obj.get_status_display())
+        return badge
     status_badge.short_description = 'Status'
     status_badge.admin_order_field = 'status'
 
@@ -88,6 +132,7 @@ class VehicleAdmin(GISModelAdmin):
         'location_updated_at'
     ]
     list_filter = ['status', 'vehicle_type']
+    list_select_related = ['home_station']
     search_fields = ['call_sign', 'registration']
     
     fieldsets = (
@@ -111,21 +156,10 @@ class VehicleAdmin(GISModelAdmin):
     )
     
     def status_badge(self, obj):
-        colors = {
-            'available': '#28a745',
-            'dispatched': '#17a2b8',
-            'en_route': '#6f42c1',
-            'on_scene': '#007bff',
-            'returning': '#fd7e14',
-            'out_of_service': '#dc3545',
-            'maintenance': '#6c757d',
-        }
-        color = colors.get(obj.status, '#6c757d')
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 2px 8px; '
-            'border-radius: 4px; font-size: 11px;">{}</span>',
-            color, obj.get_status_display()
-        )
+        badge = VEHICLE_STATUS_BADGES.get(obj.status)
+        if badge is None:
+            badge = render_badge(BADGE_DEFAULT_COLOR, obj.get_status_display())
+        return badge
     status_badge.short_description = 'Status'
     status_badge.admin_order_field = 'status'
 
@@ -139,6 +173,7 @@ class VehicleAssignmentAdmin(admin.ModelAdmin):
         'assigned_at', 'completed_at', 'is_active'
     ]
     list_filter = ['assigned_at', 'completed_at']
+    list_select_related = ['incident', 'vehicle', 'assigned_by']
     search_fields = ['incident__incident_number', 'vehicle__call_sign']
     readonly_fields = ['assigned_at']
     
@@ -154,6 +189,7 @@ class DispatcherProfileAdmin(admin.ModelAdmin):
     
     list_display = ['user', 'badge_number', 'is_on_duty', 'incidents_handled']
     list_filter = ['is_on_duty']
+    list_select_related = ['user']
     search_fields = ['user__username', 'user__email', 'badge_number']
     
     fieldsets = (
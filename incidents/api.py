@@ -7,25 +7,69 @@ Provides endpoints for:
 - Routing calculations
 - Coverage analysis
 """
+import hashlib
+
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from django.contrib.gis.db.models.functions import AsGeoJSON
 from django.contrib.gis.geos import Point
 from django.contrib.gis.measure import D
-from django.db.models import Q
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max, Q
 from django.utils import timezone
 
-from .models import Incident, Vehicle, VehicleAssignment, DispatcherProfile
+from es_locator.geojson import GEOJSON_ANNOTATION, GEOJSON_PRECISION
+
+from .models import (
+    ACTIVE_INCIDENT_STATUSES, Incident, Vehicle, VehicleAssignment, DispatcherProfile,
+)
 from .serializers import (
     IncidentSerializer, IncidentCreateSerializer, IncidentGeoSerializer,
     VehicleSerializer, VehicleGeoSerializer, VehicleLocationUpdateSerializer,
     VehicleAssignmentSerializer, DispatcherProfileSerializer
 )
+from .filters import IncidentFilterSet
 from .routing import routing_service
 from .coverage import coverage_analyzer
 
 
+# Actions serialized as GeoJSON features, which show neither the dispatcher
+# nor the assigned vehicles
+INCIDENT_GEOJSON_ACTIONS = frozenset(('geojson',))
+
+# Nearby vehicles returned by default and at most; every candidate costs an OSRM route
+DEFAULT_NEARBY_VEHICLES = 5
+MAX_NEARBY_VEHICLES = 20
+
+# Straight-line nearest vehicles routed per requested result; road ETAs can
+# reorder the closest few, so a handful more than needed are routed
+ROUTING_CANDIDATE_FACTOR = 3
+
+# Bounds on coverage response-time thresholds (minutes), which size the buffers
+MAX_RESPONSE_TIME_MIN = 60
+MAX_RESPONSE_TIME_THRESHOLDS = 5
+
+# Seconds a serialized map layer is reused; the probe in the key retires it sooner
+GEOJSON_CACHE_TTL_S = 30
+
+
+def _geojson_cache_key(prefix: str, model, request) -> str:
+    """
+    Build a cache key for a GeoJSON layer that changes with its table.
+    
+    MAX(updated_at) moves on every insert or edit and COUNT(*) on deletes,
+    so polling map clients never see a stale layer; the request path keeps
+    differently filtered layers apart.
+    """
+    probe = model.objects.aggregate(last=Max('updated_at'), total=Count('id'))
+    last = probe['last'].timestamp() if probe['last'] else 0
+    digest = hashlib.sha1(request.get_full_path().encode()).hexdigest()
+    return f"{prefix}:geojson:v1:{last}:{probe['total']}:{digest}"
+
+
 class IncidentViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing incidents.
@@ -43,42 +87,28 @@ class IncidentViewSet(viewsets.ModelViewSet):
         GET /api/incidents/active/ - List active incidents
         GET /api/incidents/geojson/ - Get incidents as GeoJSON
     """
-    queryset = Incident.objects.select_related('dispatcher').prefetch_related('assigned_vehicles').all()
+    queryset = Incident.objects.all()
     permission_classes = [IsAuthenticated]
+    filterset_class = IncidentFilterSet
     
     def get_serializer_class(self):
         if self.action == 'create':
             return IncidentCreateSerializer
-        if self.action in ['geojson', 'list_geojson']:
+        if self.action in INCIDENT_GEOJSON_ACTIONS:
             return IncidentGeoSerializer
         return IncidentSerializer
     
     def get_queryset(self):
         queryset = super().get_queryset()
         
-        # Filter by status
-        status_filter = self.request.query_params.get('status')
-        if status_filter:
-            queryset = queryset.filter(status=status_filter)
-        
-        # Filter by priority
-        priority = self.request.query_params.get('priority')
-        if priority:
-            queryset = queryset.filter(priority=priority)
-        
-        # Filter by incident type
-        incident_type = self.request.query_params.get('type')
-        if incident_type:
-            queryset = queryset.filter(incident_type=incident_type)
-        
-        # Filter by date range
-        date_from = self.request.query_params.get('date_from')
-        if date_from:
-            queryset = queryset.filter(reported_at__gte=date_from)
-        
-        date_to = self.request.query_params.get('date_to')
-        if date_to:
-            queryset = queryset.filter(reported_at__lte=date_to)
+        # Only join and prefetch relations the action's serializer renders
+        if self.action in INCIDENT_GEOJSON_ACTIONS:
+            # Points come back as GeoJSON text from PostGIS instead of via GEOS
+            queryset = queryset.defer('notes', 'properties', 'location').annotate(
+                **{GEOJSON_ANNOTATION: AsGeoJSON('location', precision=GEOJSON_PRECISION)},
+            )
+        else:
+            queryset = queryset.select_related('dispatcher').prefetch_related('assigned_vehicles')
         
         return queryset.order_by('-reported_at')
     
@@ -89,21 +119,27 @@ class IncidentViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def active(self, request):
         """Get all active incidents (pending, dispatched, en_route, on_scene)."""
-        active_statuses = ['pending', 'dispatched', 'en_route', 'on_scene']
-        queryset = self.get_queryset().filter(status__in=active_statuses)
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            status__in=ACTIVE_INCIDENT_STATUSES
+        )
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
     
     @action(detail=False, methods=['get'])
     def geojson(self, request):
         """Get incidents as GeoJSON FeatureCollection."""
-        queryset = self.filter_queryset(self.get_queryset())
-        serializer = IncidentGeoSerializer(queryset, many=True)
-        
-        return Response({
-            'type': 'FeatureCollection',
-            'features': serializer.data,
-        })
+        cache_key = _geojson_cache_key('incidents', Incident, request)
+        data = cache.get(cache_key)
+        if data is None:
+            queryset = self.filter_queryset(self.get_queryset())
+            serializer = IncidentGeoSerializer(queryset, many=True)
+            data = {
+                'type': 'FeatureCollection',
+                'features': serializer.data,
+            }
+            cache.set(cache_key, data, GEOJSON_CACHE_TTL_S)
+        
+        return Response(data)
     
     @action(detail=True, methods=['post'], url_path='assign-vehicle')
     def assign_vehicle(self, request, pk=None):
@@ -138,7 +174,7 @@ class IncidentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Calculate route
+        # Calculate route before claiming, keeping the OSRM call out of the transaction
         route_info = None
         if vehicle.current_location and incident.location:
             vehicle_loc = (vehicle.current_location.y, vehicle.current_location.x)
@@ -147,26 +183,39 @@ class IncidentViewSet(viewsets.ModelViewSet):
             if route:
                 route_info = route.to_dict()
         
-        # Create assignment
-        assignment = VehicleAssignment.objects.create(
-            incident=incident,
-            vehicle=vehicle,
-            assigned_by=request.user,
-            notes=notes,
-            route_geometry=route_info.get('geometry') if route_info else None,
-            route_distance_m=route_info.get('distance_m') if route_info else None,
-            route_duration_s=route_info.get('duration_s') if route_info else None,
-        )
-        
-        # Update incident and vehicle status
-        incident.status = 'dispatched'
-        incident.dispatcher = request.user
-        incident.dispatched_at = timezone.now()
-        incident.save()
-        
-        vehicle.status = 'dispatched'
-        vehicle.current_incident = incident
-        vehicle.save()
+        now = timezone.now()
+        with transaction.atomic():
+            # Claim the vehicle with a conditional UPDATE so two dispatchers
+            # racing for it cannot both assign it
+            claimed = Vehicle.objects.filter(id=vehicle.id, status='available').update(
+                status='dispatched',
+                current_incident=incident,
+                updated_at=now,
+            )
+            if not claimed:
+                return Response(
+                    {'error': 'Vehicle is no longer available'},
+                    status=status.HTTP_409_CONFLICT
+                )
+            vehicle.status = 'dispatched'
+            vehicle.current_incident = incident
+            
+            # Create assignment
+            assignment = VehicleAssignment.objects.create(
+                incident=incident,
+                vehicle=vehicle,
+                assigned_by=request.user,
+                notes=notes,
+                route_geometry=route_info.get('geometry') if route_info else None,
+                route_distance_m=route_info.get('distance_m') if route_info else None,
+                route_duration_s=route_info.get('duration_s') if route_info else None,
+            )
+            
+            # Update incident status
+            incident.status = 'dispatched'
+            incident.dispatcher = request.user
+            incident.dispatched_at = now
+            incident.save(update_fields=['status', 'dispatcher', 'dispatched_at', 'updated_at'])
         
         return Response({
             'message': 'Vehicle assigned successfully',
@@ -185,25 +234,27 @@ class IncidentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        incident.status = 'resolved'
-        incident.resolved_at = timezone.now()
-        incident.save()
-        
-        # Release assigned vehicles
-        for vehicle in incident.assigned_vehicles.all():
-            vehicle.status = 'available'
-            vehicle.current_incident = None
-            vehicle.save()
+        now = timezone.now()
+        with transaction.atomic():
+            incident.status = 'resolved'
+            incident.resolved_at = now
+            incident.save(update_fields=['status', 'resolved_at', 'updated_at'])
             
-            # Complete the assignment
-            assignment = VehicleAssignment.objects.filter(
+            # Release assigned vehicles with one UPDATE instead of a save per vehicle
+            vehicles = list(incident.assigned_vehicles.all())
+            for vehicle in vehicles:
+                vehicle.status = 'available'
+                vehicle.current_incident = None
+                # bulk_update does not apply auto_now
+                vehicle.updated_at = now
+            Vehicle.objects.bulk_update(vehicles, ['status', 'current_incident', 'updated_at'])
+            
+            # Complete their open assignments in a single statement
+            VehicleAssignment.objects.filter(
                 incident=incident,
-                vehicle=vehicle,
+                vehicle__in=vehicles,
                 completed_at__isnull=True
-            ).first()
-            if assignment:
-                assignment.completed_at = timezone.now()
-                assignment.save()
+            ).update(completed_at=now)
         
         return Response({
             'message': 'Incident resolved',
@@ -214,17 +265,25 @@ class IncidentViewSet(viewsets.ModelViewSet):
     def nearby_vehicles(self, request, pk=None):
         """Find nearby available vehicles for this incident."""
         incident = self.get_object()
-        max_results = int(request.query_params.get('limit', 5))
+        try:
+            max_results = int(request.query_params.get('limit', DEFAULT_NEARBY_VEHICLES))
+        except ValueError:
+            return Response(
+                {'error': 'limit must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        max_results = max(1, min(max_results, MAX_NEARBY_VEHICLES))
         
-        available_vehicles = Vehicle.objects.filter(
-            status='available',
-            current_location__isnull=False
+        # Route only the straight-line nearest candidates, not the whole fleet
+        candidates = Vehicle.objects.nearest_available(
+            incident.location,
+            limit=max_results * ROUTING_CANDIDATE_FACTOR
         )
         
         incident_location = (incident.location.y, incident.location.x)
         results = routing_service.find_nearest_vehicles(
             incident_location,
-            list(available_vehicles),
+            list(candidates),
             max_results
         )
         
@@ -263,6 +322,12 @@ class VehicleViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         queryset = super().get_queryset()
         
+        if self.action == 'geojson':
+            # Points come back as GeoJSON text from PostGIS instead of via GEOS
+            queryset = queryset.defer('current_location').annotate(
+                **{GEOJSON_ANNOTATION: AsGeoJSON('current_location', precision=GEOJSON_PRECISION)},
+            )
+        
         # Filter by status
         status_filter = self.request.query_params.get('status')
         if status_filter:
@@ -290,13 +355,18 @@ class VehicleViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def geojson(self, request):
         """Get vehicles as GeoJSON FeatureCollection."""
-        queryset = self.filter_queryset(self.get_queryset())
-        serializer = VehicleGeoSerializer(queryset, many=True)
-        
-        return Response({
-            'type': 'FeatureCollection',
-            'features': serializer.data,
-        })
+        cache_key = _geojson_cache_key('vehicles', Vehicle, request)
+        data = cache.get(cache_key)
+        if data is None:
+            queryset = self.filter_queryset(self.get_queryset())
+            serializer = VehicleGeoSerializer(queryset, many=True)
+            data = {
+                'type': 'FeatureCollection',
+                'features': serializer.data,
+            }
+            cache.set(cache_key, data, GEOJSON_CACHE_TTL_S)
+        
+        return Response(data)
     
     @action(detail=True, methods=['patch'], url_path='location')
     def update_location(self, request, pk=None):
@@ -313,13 +383,11 @@ class VehicleViewSet(viewsets.ModelViewSet):
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         
-        vehicle.current_location = Point(
-            serializer.validated_data['longitude'],
+        # Writes only the location columns; GPS trackers call this constantly
+        vehicle.update_location(
             serializer.validated_data['latitude'],
-            srid=4326
+            serializer.validated_data['longitude'],
         )
-        vehicle.location_updated_at = timezone.now()
-        vehicle.save()
         
         return Response({
             'message': 'Location updated',
@@ -383,10 +451,26 @@ class RoutingViewSet(viewsets.ViewSet):
             incident_id: int (optional, provide location if not using incident)
             location: {latitude: float, longitude: float} (optional)
             vehicle_types: [str] (optional, list of required vehicle types)
+            limit: int (optional, nearest vehicles per type compared by road ETA,
+                default 5, max 20)
         """
         incident_id = request.data.get('incident_id')
         location = request.data.get('location')
-        vehicle_types = request.data.get('vehicle_types', [])
+        vehicle_types = request.data.get('vehicle_types') or []
+        
+        if not isinstance(vehicle_types, list) or not all(isinstance(t, str) for t in vehicle_types):
+            return Response(
+                {'error': 'vehicle_types must be a list of strings'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            limit = int(request.data.get('limit', DEFAULT_NEARBY_VEHICLES))
+        except (TypeError, ValueError):
+            return Response(
+                {'error': 'limit must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        limit = max(1, min(limit, MAX_NEARBY_VEHICLES))
         
         if incident_id:
             try:
@@ -399,8 +483,8 @@ class RoutingViewSet(viewsets.ViewSet):
                 )
         elif location:
             try:
-                location_coords = (location['latitude'], location['longitude'])
-            except (KeyError, TypeError):
+                location_coords = (float(location['latitude']), float(location['longitude']))
+            except (KeyError, TypeError, ValueError):
                 return Response(
                     {'error': 'Invalid location format'},
                     status=status.HTTP_400_BAD_REQUEST
@@ -411,14 +495,26 @@ class RoutingViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        available_vehicles = Vehicle.objects.filter(
-            status='available',
-            current_location__isnull=False
-        )
+        # Shortlist the straight-line nearest vehicles of each required type
+        # with a KNN index scan, so only those are routed through OSRM
+        point = Point(location_coords[1], location_coords[0], srid=4326)
+        if vehicle_types:
+            candidates = []
+            for vehicle_type in set(vehicle_types):
+                needed = vehicle_types.count(vehicle_type)
+                candidates.extend(
+                    Vehicle.objects.nearest_available(
+                        point, vehicle_type, max(needed, limit) * ROUTING_CANDIDATE_FACTOR
+                    )
+                )
+        else:
+            candidates = list(
+                Vehicle.objects.nearest_available(point, limit=limit * ROUTING_CANDIDATE_FACTOR)
+            )
         
         assignments = routing_service.optimize_assignment(
             location_coords,
-            list(available_vehicles),
+            candidates,
             vehicle_types if vehicle_types else None
         )
         
@@ -456,14 +552,26 @@ class CoverageViewSet(viewsets.ViewSet):
         response_times = request.query_params.get('response_times')
         
         # Parse parameters
-        if county_id:
-            county_id = int(county_id)
+        try:
+            if county_id:
+                county_id = int(county_id)
+            
+            if response_times:
+                response_times = [int(rt.strip()) for rt in response_times.split(',')]
+        except ValueError:
+            return Response(
+                {'error': 'county_id and response_times must be integers'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
         if facility_types:
             facility_types = [ft.strip() for ft in facility_types.split(',')]
         
         if response_times:
-            response_times = [int(rt.strip()) for rt in response_times.split(',')]
+            # Each threshold is a full buffer analysis; clamp and de-duplicate
+            # them, keeping the caller's order (the first one drives gap detection)
+            clamped = (max(1, min(rt, MAX_RESPONSE_TIME_MIN)) for rt in response_times)
+            response_times = list(dict.fromkeys(clamped))[:MAX_RESPONSE_TIME_THRESHOLDS]
         
         results = coverage_analyzer.analyze_coverage(
             county_id=county_id,
@@ -483,7 +591,14 @@ class CoverageViewSet(viewsets.ViewSet):
             response_time: int (optional, minutes, default 10)
         """
         vehicle_type = request.query_params.get('vehicle_type')
-        response_time = int(request.query_params.get('response_time', 10))
+        try:
+            response_time = int(request.query_params.get('response_time', 10))
+        except ValueError:
+            return Response(
+                {'error': 'response_time must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        response_time = max(1, min(response_time, MAX_RESPONSE_TIME_MIN))
         
         results = coverage_analyzer.get_vehicle_coverage(
             vehicle_type=vehicle_type,
@@ -135,12 +135,11 @@ class IncidentConsumer(AsyncJsonWebsocketConsumer):
     @database_sync_to_async
     def get_active_incidents(self):
         """Get all active incidents."""
-        from .models import Incident
+        from .models import ACTIVE_INCIDENT_STATUSES, Incident
         from .serializers import IncidentSerializer
         
-        active_statuses = ['pending', 'dispatched', 'en_route', 'on_scene']
         incidents = Incident.objects.filter(
-            status__in=active_statuses
+            status__in=ACTIVE_INCIDENT_STATUSES
         ).select_related('dispatcher')
         
         return IncidentSerializer(incidents, many=True).data
@@ -357,13 +356,11 @@ class DispatchConsumer(AsyncJsonWebsocketConsumer):
     @database_sync_to_async
     def get_dashboard_state(self):
         """Get full dashboard state."""
-        from .models import Incident, Vehicle
+        from .models import ACTIVE_INCIDENT_STATUSES, Incident, Vehicle
         from .serializers import IncidentSerializer, VehicleSerializer
         
-        active_statuses = ['pending', 'dispatched', 'en_route', 'on_scene']
-        
         incidents = Incident.objects.filter(
-            status__in=active_statuses
+            status__in=ACTIVE_INCIDENT_STATUSES
         ).select_related('assigned_vehicle', 'county')
         
         vehicles = Vehicle.objects.filter(
@@ -0,0 +1,29 @@
+"""
+FilterSets for incident API endpoints.
+
+Query strings are parsed and validated once in the filter form, so the ORM
+receives typed values and malformed dates are rejected with a 400.
+"""
+import django_filters
+
+from .models import Incident
+
+
+class IncidentFilterSet(django_filters.FilterSet):
+    """
+    Filter incidents by status, priority, type and report time.
+    
+    ?status=pending&priority=high&type=fire
+    ?date_from=2025-01-01T00:00:00Z&date_to=2025-01-31T23:59:59Z
+    """
+
+    # Plain CharFilters: unknown values match nothing rather than erroring
+    status = django_filters.CharFilter()
+    priority = django_filters.CharFilter()
+    type = django_filters.CharFilter(field_name='incident_type')
+    date_from = django_filters.IsoDateTimeFilter(field_name='reported_at', lookup_expr='gte')
+    date_to = django_filters.IsoDateTimeFilter(field_name='reported_at', lookup_expr='lte')
+
+    class Meta:
+        model = Incident
+        fields = ['status', 'priority', 'type', 'date_from', 'date_to']
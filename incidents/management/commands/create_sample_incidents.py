@@ -104,14 +104,18 @@ class Command(BaseCommand):
             'rescue': ['RU', 'RT'],  # Rescue Unit, Rescue Team
         }
 
+        # Load existing call signs once instead of querying per vehicle
+        existing_call_signs = set(Vehicle.objects.values_list('call_sign', flat=True))
+
         for i in range(options['vehicles']):
             vehicle_type = random.choice(['fire', 'ambulance', 'police', 'rescue'])
             prefix = random.choice(vehicle_prefixes[vehicle_type])
             call_sign = f'{prefix}-{random.randint(100, 999)}'
             
             # Check if call sign already exists
-            if Vehicle.objects.filter(call_sign=call_sign).exists():
+            if call_sign in existing_call_signs:
                 continue
+            existing_call_signs.add(call_sign)
 
             # Select home station based on vehicle type
             home_station = None
@@ -197,6 +201,11 @@ class Command(BaseCommand):
             ]
         }
 
+        # Look up today's next incident number once and increment it locally,
+        # so Incident.save() skips its per-row "last number" query
+        number_prefix, _, next_seq = Incident()._generate_incident_number().rpartition('-')
+        next_seq = int(next_seq)
+
         for i in range(options['incidents']):
             incident_type = random.choice(incident_types)
             priority = random.choices(
@@ -220,6 +229,7 @@ class Command(BaseCommand):
             title = random.choice(incident_titles.get(incident_type, incident_titles['other']))
 
             incident = Incident.objects.create(
+                incident_number=f'{number_prefix}-{next_seq:04d}',
                 incident_type=incident_type,
                 priority=priority,
                 status=status,
@@ -229,6 +239,7 @@ class Command(BaseCommand):
                 reporter_name='Automated Test',
                 reporter_phone='999'
             )
+            next_seq += 1
             incidents_created += 1
 
         self.stdout.write(self.style.SUCCESS(f'Created {incidents_created} incidents'))
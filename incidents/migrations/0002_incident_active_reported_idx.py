@@ -0,0 +1,27 @@
+"""
+Add a partial index for the active-incident list, newest first.
+
+Built concurrently so the incidents table stays writable while it builds.
+"""
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('incidents', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='incident',
+            index=models.Index(
+                condition=models.Q(('status__in', ('pending', 'dispatched', 'en_route', 'on_scene'))),
+                fields=['-reported_at'],
+                name='incident_active_reported_idx',
+            ),
+        ),
+    ]
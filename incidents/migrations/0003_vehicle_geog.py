@@ -0,0 +1,36 @@
+"""
+Add a stored geography copy of Vehicle.current_location with its own GiST index.
+
+Nearest-vehicle shortlists order by <-> on this column, which is exact on the
+sphere, instead of by planar degrees on current_location.
+"""
+import django.contrib.gis.db.models.fields
+from django.contrib.postgres.indexes import GistIndex
+from django.db import migrations, models
+from django.db.models.functions import Cast
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0002_incident_active_reported_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vehicle',
+            name='geog',
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=Cast(
+                    'current_location',
+                    output_field=django.contrib.gis.db.models.fields.PointField(geography=True, srid=4326),
+                ),
+                output_field=django.contrib.gis.db.models.fields.PointField(geography=True, srid=4326),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='vehicle',
+            index=GistIndex(fields=['geog'], name='vehicle_geog_gix'),
+        ),
+    ]
@@ -7,8 +7,11 @@ and dispatcher operations with PostGIS spatial support.
 import uuid
 from django.conf import settings
 from django.contrib.gis.db import models
-from django.contrib.gis.db.models.functions import Distance
+from django.contrib.gis.db.models.functions import Distance, GeometryDistance
 from django.contrib.gis.geos import Point
+from django.contrib.postgres.indexes import GistIndex
+from django.db.models import Value
+from django.db.models.functions import Cast
 from django.utils import timezone
 
 
@@ -42,6 +45,13 @@ INCIDENT_STATUS_CHOICES = (
     ('cancelled', 'Cancelled'),
 )
 
+# Statuses of incidents still being worked; kept as one tuple so queries
+# repeat the exact predicate of the partial index below
+ACTIVE_INCIDENT_STATUSES = ('pending', 'dispatched', 'en_route', 'on_scene')
+
+# Statuses that close an incident (frozenset for O(1) membership checks)
+CLOSED_INCIDENT_STATUSES = frozenset(('resolved', 'cancelled'))
+
 # Vehicle type choices
 VEHICLE_TYPE_CHOICES = (
     ('ambulance', 'Ambulance'),
@@ -71,7 +81,7 @@ class IncidentQuerySet(models.QuerySet):
 
     def active(self):
         """Return only active (non-resolved, non-cancelled) incidents."""
-        return self.exclude(status__in=['resolved', 'cancelled'])
+        return self.exclude(status__in=CLOSED_INCIDENT_STATUSES)
 
     def pending(self):
         """Return pending incidents awaiting dispatch."""
@@ -179,6 +189,12 @@ class Incident(models.Model):
         indexes = [
             models.Index(fields=['status', 'priority', 'reported_at']),
             models.Index(fields=['incident_type', 'status']),
+            # Active incidents are a small, hot slice of the table
+            models.Index(
+                fields=['-reported_at'],
+                name='incident_active_reported_idx',
+                condition=models.Q(status__in=ACTIVE_INCIDENT_STATUSES),
+            ),
         ]
     
     def save(self, *args, **kwargs):
@@ -213,7 +229,7 @@ class Incident(models.Model):
     @property
     def is_active(self) -> bool:
         """Check if incident is still active."""
-        return self.status not in ['resolved', 'cancelled']
+        return self.status not in CLOSED_INCIDENT_STATUSES
     
     @property
     def response_time(self):
@@ -268,11 +284,23 @@ class VehicleQuerySet(models.QuerySet):
         return self.filter(vehicle_type=vehicle_type)
 
     def nearest_available(self, point: Point, vehicle_type: str = None, limit: int = 5):
-        """Find nearest available vehicles to a point."""
-        qs = self.available()
+        """
+        Find nearest available vehicles to a point.
+        
+        The PostGIS ``<->`` operator on the stored geography column walks its
+        GiST index in sphere-distance order, so only ``limit`` rows are read
+        however large the fleet is, and they are the true nearest vehicles.
+        Vehicles without a location are skipped.
+        """
+        qs = self.available().filter(current_location__isnull=False)
         if vehicle_type:
             qs = qs.filter(vehicle_type=vehicle_type)
-        return qs.annotate(distance=Distance('current_location', point)).order_by('distance')[:limit]
+        # Bind the point as geography so <-> compares geography to geography
+        geog_point = Value(point, output_field=models.PointField(geography=True, srid=4326))
+        return (
+            qs.annotate(distance=Distance('geog', point))
+            .order_by(GeometryDistance('geog', geog_point))[:limit]
+        )
 
 
 class Vehicle(models.Model):
@@ -326,6 +354,12 @@ class Vehicle(models.Model):
         blank=True,
         help_text="Current vehicle location (WGS84)"
     )
+    # Stored geography copy of current_location for exact nearest-vehicle ordering
+    geog = models.GeneratedField(
+        expression=Cast('current_location', output_field=models.PointField(geography=True, srid=4326)),
+        output_field=models.PointField(geography=True, srid=4326),
+        db_persist=True,
+    )
     location_updated_at = models.DateTimeField(null=True, blank=True)
     
     # Home station (for returning)
@@ -365,6 +399,7 @@ class Vehicle(models.Model):
         ordering = ['call_sign']
         indexes = [
             models.Index(fields=['vehicle_type', 'status']),
+            GistIndex(fields=['geog'], name='vehicle_geog_gix'),
         ]
     
     def __str__(self) -> str:
@@ -9,11 +9,18 @@ import requests
 from dataclasses import dataclass
 from typing import Optional, List, Tuple
 from django.conf import settings
+from django.core.cache import cache
 from django.contrib.gis.geos import Point, LineString
 
 
 logger = logging.getLogger(__name__)
 
+# Decimal places endpoints are rounded to when keying cached routes (~11 m)
+ROUTE_CACHE_PRECISION = 4
+
+# Seconds an OSRM route is reused between the same rounded endpoints
+ROUTE_CACHE_TTL_S = 3600
+
 
 @dataclass
 class RouteResult:
@@ -60,11 +67,38 @@ class RoutingService:
         Returns:
             RouteResult with distance, duration, geometry and instructions
         """
+        cache_key = self._route_cache_key(origin, destination, vehicle_type)
+        route = cache.get(cache_key)
+        if route is not None:
+            return route
+        
         try:
-            return self._osrm_route(origin, destination, vehicle_type)
+            route = self._osrm_route(origin, destination, vehicle_type)
         except Exception as e:
             logger.warning(f"OSRM routing failed: {e}, falling back to direct distance")
             return self._fallback_route(origin, destination)
+        
+        # Only OSRM answers are cached, so fallbacks never outlive an outage
+        cache.set(cache_key, route, ROUTE_CACHE_TTL_S)
+        return route
+    
+    def _route_cache_key(
+        self,
+        origin: Tuple[float, float],
+        destination: Tuple[float, float],
+        vehicle_type: str = None
+    ) -> str:
+        """
+        Build the cache key for a route between two rounded endpoints.
+        
+        Dispatch traffic repeats the same station-to-incident pairs, so
+        rounding lets nearby requests share one OSRM answer.
+        """
+        coords = ':'.join(
+            f"{float(value):.{ROUTE_CACHE_PRECISION}f}"
+            for value in (*origin, *destination)
+        )
+        return f"route:v1:{vehicle_type or 'driving'}:{coords}"
     
     def _osrm_route(
         self,
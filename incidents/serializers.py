@@ -8,6 +8,8 @@ from rest_framework import serializers
 from rest_framework_gis.fields import GeometryField
 from rest_framework_gis.serializers import GeoFeatureModelSerializer
 
+from es_locator.geojson import AnnotatedGeometryMixin
+
 from .models import Incident, Vehicle, VehicleAssignment, DispatcherProfile
 
 
@@ -65,7 +67,7 @@ class IncidentSerializer(serializers.ModelSerializer):
         } for v in vehicles]
 
 
-class IncidentGeoSerializer(GeoFeatureModelSerializer):
+class IncidentGeoSerializer(AnnotatedGeometryMixin, GeoFeatureModelSerializer):
     """
     GeoJSON serializer for incidents.
     
@@ -172,7 +174,7 @@ class VehicleSerializer(serializers.ModelSerializer):
         return None
 
 
-class VehicleGeoSerializer(GeoFeatureModelSerializer):
+class VehicleGeoSerializer(AnnotatedGeometryMixin, GeoFeatureModelSerializer):
     """
     GeoJSON serializer for vehicles.
     
@@ -2,12 +2,14 @@
 URL routing for incidents app REST API.
 """
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 from .api import IncidentViewSet, VehicleViewSet, RoutingViewSet, CoverageViewSet
 
 
-router = DefaultRouter()
+# The project router in es_locator/urls.py already serves the /api/ root view;
+# SimpleRouter avoids a second, unreachable root and its format-suffix routes
+router = SimpleRouter()
 router.register(r'incidents', IncidentViewSet, basename='incident')
 router.register(r'vehicles', VehicleViewSet, basename='vehicle')
 router.register(r'routing', RoutingViewSet, basename='routing')
@@ -1,12 +1,14 @@
 """
 Views for the emergency services dashboard.
 """
+from collections import Counter
+
 from django.views.generic import TemplateView
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.db.models import Count, Q
 from django.utils import timezone
 
-from .models import Incident, Vehicle
+from .models import ACTIVE_INCIDENT_STATUSES, Incident, Vehicle
 
 
 class DashboardView(LoginRequiredMixin, TemplateView):
@@ -24,29 +26,20 @@ class DashboardView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
-        # Active incidents
-        active_statuses = ['pending', 'dispatched', 'en_route', 'on_scene']
-        active_incidents = Incident.objects.filter(
-            status__in=active_statuses
-        )
+        # Active incidents, fetched once; the template lists them and the
+        # status/priority counts are tallied from the same rows
+        active_incidents = list(Incident.objects.filter(
+            status__in=ACTIVE_INCIDENT_STATUSES
+        ))
         
         # Incident counts by status
-        incident_counts = Incident.objects.filter(
-            status__in=active_statuses
-        ).values('status').annotate(count=Count('id'))
-        
-        status_counts = {item['status']: item['count'] for item in incident_counts}
+        status_counts = Counter(incident.status for incident in active_incidents)
         
         # Priority breakdown
-        priority_counts = Incident.objects.filter(
-            status__in=active_statuses
-        ).values('priority').annotate(count=Count('id'))
-        
-        priority_breakdown = {item['priority']: item['count'] for item in priority_counts}
+        priority_breakdown = dict(Counter(incident.priority for incident in active_incidents))
         
         # Vehicle summary
-        vehicles = Vehicle.objects.all()
-        vehicle_summary = vehicles.values('status').annotate(count=Count('id'))
+        vehicle_summary = Vehicle.objects.values('status').annotate(count=Count('id'))
         vehicle_counts = {item['status']: item['count'] for item in vehicle_summary}
         
         # Recent incidents (last 24 hours)
@@ -64,7 +57,7 @@ class DashboardView(LoginRequiredMixin, TemplateView):
             'priority_breakdown': priority_breakdown,
             'vehicle_counts': vehicle_counts,
             'available_vehicles': vehicle_counts.get('available', 0),
-            'total_vehicles': vehicles.count(),
+            'total_vehicles': sum(vehicle_counts.values()),
             'recent_incidents': recent_incidents,
         })
         